@@ -0,0 +1,24 @@
+"""
+gunicorn.conf.py — picked up automatically by `gunicorn app:app`
+
+Threaded workers (gthread): while one thread is busy hashing a password
+(Argon2 runs in C and releases the GIL), the other threads in the same
+worker keep answering /api/tasks instead of waiting behind the login.
+
+The API is mostly waiting on the database, and a waiting thread costs
+little — to serve more requests at once, raise GUNICORN_THREADS before
+adding workers (each worker is a full copy of the app). Password hashing is
+the exception (~19 MiB per Argon2 call); app.py caps it at HASH_CONCURRENCY
+hashes per worker, whatever the thread count.
+
+app.py reads GUNICORN_THREADS too and gives each worker's DB pool one
+connection per thread (also behind PgBouncer), so no thread waits for one.
+If you set DB_POOL_SIZE yourself, keep it >= threads.
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '5000')}"
+workers = int(os.environ.get('WEB_CONCURRENCY', 2))
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', 16))